@@ -1,23 +1,210 @@
 import json
-import csv
+import math
+import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Set
-from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Union
 import logging
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library parser
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # Without orjson, claims fall back to ijson or json
+    simdjson = None
+
+try:
+    import ijson
+except ImportError:  # Without orjson, claims files are read whole
+    ijson = None
+
+try:
+    from numba import njit
+except ImportError:  # Group aggregation falls back to np.bincount
+    njit = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _load_json(path: Path):
+    """Parse a JSON file, using orjson when it is available."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _finite_or_none(obj):
+    """Replace non-finite floats in obj with None, recursing into containers."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite_or_none(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_finite_or_none(value) for value in obj]
+    return obj
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, using orjson when it is available.
+
+    Non-finite floats (e.g. an infinite chain avg_price from a zero
+    quantity) are written as null on both paths, since Infinity and NaN
+    are not valid JSON and orjson cannot emit them.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        _finite_or_none(obj), ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _stream_json_records(path: Path):
+    """Yield the records of a JSON file one at a time.
+
+    Top-level arrays are streamed with ijson (yajl2_c backend when built),
+    so the whole array never has to be held in memory at once. Any other
+    document is loaded normally and yielded as a single record.
+    """
+    with open(path, "rb") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == b"[":
+            yield from ijson.items(f, "item", use_float=True)
+            return
+    yield _load_json(path)
+
+
+# Fields a claim record must have to be loaded at all
+_REQUIRED_CLAIM_FIELDS = frozenset(
+    ["id", "npi", "ndc", "price", "quantity", "timestamp"]
+)
+
+# Claim fields kept after ingest and the dtype of their column arrays
+_CLAIM_COLUMNS = {
+    "id": object,
+    "npi": object,
+    "ndc": object,
+    "price": np.float64,
+    "quantity": np.float64,
+}
+
+# Claim fields that repeat heavily and are stored as pd.Categorical
+_CATEGORICAL_CLAIM_COLUMNS = ("npi", "ndc")
+
+# Container types a parsed JSON array may come back as
+_JSON_ARRAYS = (list,) if simdjson is None else (list, simdjson.Array)
+
+
+def _read_claims_file(json_file: Path) -> Dict[str, np.ndarray]:
+    """Parse a claims file into one array per field in _CLAIM_COLUMNS.
+
+    orjson parses the whole file when it is installed: five of the six
+    claim fields are read anyway, so one orjson pass beats per-field
+    pysimdjson proxy lookups. Without orjson, pysimdjson parses lazily
+    (its parser is local so the proxies are released before the next
+    file), then ijson streams the records, then the stdlib json loads.
+
+    Runs in a worker process, so it only relies on module-level state.
+    """
+    if orjson is None and simdjson is not None:
+        data = simdjson.Parser().load(json_file)
+        claims_batch = data if isinstance(data, _JSON_ARRAYS) else [data]
+    elif orjson is None and ijson is not None:
+        claims_batch = _stream_json_records(json_file)
+    else:
+        data = _load_json(json_file)
+        claims_batch = data if isinstance(data, _JSON_ARRAYS) else [data]
+
+    # Pull each field straight into its own array: no per-claim row tuple
+    # that would have to be unzipped again, and far less GC churn
+    # (the schema check is _validate_claim's, bound to the set so the filter
+    # makes no Python-level call per claim)
+    claims = list(filter(_REQUIRED_CLAIM_FIELDS.issubset, claims_batch))
+    columns = {}
+    for name, dtype in _CLAIM_COLUMNS.items():
+        values = map(itemgetter(name), claims)
+        if dtype is object:
+            columns[name] = np.fromiter(values, dtype=object, count=len(claims))
+            continue
+        try:
+            columns[name] = np.fromiter(values, dtype=dtype, count=len(claims))
+        except (TypeError, ValueError):
+            # Check price and quantity types in one vectorized pass: values
+            # that are not numeric coerce to NaN and those claims are dropped
+            values = np.fromiter(
+                map(itemgetter(name), claims), dtype=object, count=len(claims)
+            )
+            columns[name] = pd.to_numeric(values, errors="coerce").astype(dtype)
+
+    # Drop claims with a non-numeric price or quantity, an infinite
+    # quantity (which int() rejected) or a null npi/ndc key
+    valid = (
+        ~np.isnan(columns["price"])
+        & np.isfinite(columns["quantity"])
+        & pd.notna(columns["npi"])
+        & pd.notna(columns["ndc"])
+    )
+
+    if valid.all():
+        return columns
+    return {name: values[valid] for name, values in columns.items()}
+
+
+def _aggregate_groups(gid, ngroups, price, unit_price, reverted):
+    """Accumulate fills, reverts, unit-price sum and total price per group."""
+    fills = np.bincount(gid, minlength=ngroups)
+    reverted_count = np.bincount(gid, weights=reverted, minlength=ngroups)
+    unit_sum = np.bincount(gid, weights=unit_price, minlength=ngroups)
+    total_price = np.bincount(gid, weights=price, minlength=ngroups)
+    return fills, reverted_count.astype(np.int64), unit_sum, total_price
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _aggregate_groups(gid, ngroups, price, unit_price, reverted):
+        """Compiled single-pass equivalent of the bincount version above."""
+        fills = np.zeros(ngroups, np.int64)
+        reverted_count = np.zeros(ngroups, np.int64)
+        unit_sum = np.zeros(ngroups, np.float64)
+        total_price = np.zeros(ngroups, np.float64)
+        for i in range(gid.shape[0]):
+            g = gid[i]
+            fills[g] += 1
+            total_price[g] += price[i]
+            unit_sum[g] += unit_price[i]
+            reverted_count[g] += reverted[i]
+        return fills, reverted_count, unit_sum, total_price
+
+
 class PharmacyDataProcessor:
     """Processes pharmacy claims and reverts data to calculate metrics."""
 
     def __init__(self):
         self.pharmacies: Dict[str, str] = {}
-        self.valid_npis: Set[str] = set()
-        self.claims: List[Dict] = []
+        # self.pharmacies as a Series indexed by npi, for vectorized lookups
+        self._pharm_series = pd.Series(dtype=object, name="chain")
+        self.valid_npis: FrozenSet[str] = frozenset()
+        # Claims are stored column-wise, one array per field in _CLAIM_COLUMNS
+        self.claims: Dict[str, Union[np.ndarray, pd.Categorical]] = {
+            name: np.empty(0, dtype=dtype) for name, dtype in _CLAIM_COLUMNS.items()
+        }
+        # Shared DataFrame for the pandas analyses; see _claims_frame()
+        self._claims_df: Optional[pd.DataFrame] = None
         self.reverts: List[Dict] = []
 
     def load_pharmacies(self, pharmacy_dir: str) -> None:
@@ -28,53 +215,98 @@ class PharmacyDataProcessor:
         if not pharmacy_path.exists():
             raise FileNotFoundError(f"Pharmacy directory not found: {pharmacy_dir}")
 
-        # Process all CSV files in the directory
+        # Read all CSV files in the directory, then clean them in one pass.
+        # NPIs are read as strings so leading zeros survive.
+        frames = []
         for csv_file in pharmacy_path.glob("*.csv"):
             logger.info(f"Processing pharmacy file: {csv_file}")
             try:
-                with open(csv_file, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if "npi" in row and "chain" in row:
-                            npi = row["npi"].strip()
-                            chain = row["chain"].strip()
-                            if npi and chain:
-                                self.pharmacies[npi] = chain
-                                self.valid_npis.add(npi)
+                frames.append(
+                    pd.read_csv(
+                        csv_file,
+                        usecols=["npi", "chain"],
+                        dtype=str,
+                        keep_default_na=False,
+                        encoding="utf-8",
+                    )
+                )
             except Exception as e:
                 logger.error(f"Error reading pharmacy file {csv_file}: {e}")
 
+        if frames:
+            df = pd.concat(frames, ignore_index=True).dropna()
+            npi = df["npi"].str.strip()
+            chain = df["chain"].str.strip()
+            keep = (npi != "") & (chain != "")
+            # One C-level dict build and update instead of a write per row;
+            # later rows win for duplicate NPIs, as with per-row writes
+            loaded = dict(zip(npi[keep].tolist(), chain[keep].tolist()))
+            self.pharmacies.update(loaded)
+            self.valid_npis = self.valid_npis.union(loaded)
+            self._pharm_series = pd.Series(self.pharmacies, name="chain")
+            self._claims_df = None
+
         logger.info(f"Loaded {len(self.pharmacies)} pharmacies")
 
-    def load_claims(self, claims_dir: str) -> None:
-        """Load claims data from JSON files in a single directory."""
+    def load_claims(self, claims_dir: str, max_workers: Optional[int] = None) -> None:
+        """Load claims data from JSON files in a single directory.
+
+        Files are parsed across up to max_workers processes (default: one
+        per CPU). A single file, or a single worker, is parsed in-process.
+        """
         logger.info(f"Loading claims from {claims_dir}")
 
         claims_path = Path(claims_dir)
         if not claims_path.exists():
             raise FileNotFoundError(f"Claims directory not found: {claims_dir}")
 
-        # Process all JSON files in the directory
-        for json_file in claims_path.glob("*.json"):
-            logger.info(f"Processing claims file: {json_file}")
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+        # Parse all JSON files in the directory, across worker processes
+        # when there is more than one file to spread out
+        json_files = list(claims_path.glob("*.json"))
+        workers = max_workers or os.cpu_count() or 1
+        use_pool = workers > 1 and len(json_files) > 1
+        parsed = []
+        with ProcessPoolExecutor(workers) if use_pool else nullcontext() as pool:
+            if use_pool:
+                parsers = [pool.submit(_read_claims_file, f).result for f in json_files]
+            else:
+                parsers = [partial(_read_claims_file, f) for f in json_files]
+            for json_file, parse in zip(json_files, parsers):
+                logger.info(f"Processing claims file: {json_file}")
+                try:
+                    parsed.append(parse())
+                except Exception as e:
+                    logger.error(f"Error reading claims file {json_file}: {e}")
+
+        if parsed:
+            # Keep only claims from known pharmacies, one hashed isin per file
+            # (an object Index skips pandas' inference of a pyarrow str dtype)
+            keeps = [
+                pd.Index(columns["npi"], dtype=object).isin(self.valid_npis)
+                for columns in parsed
+            ]
+
+            # Append to the contiguous arrays shared by every analysis, with
+            # one copy per column
+            for name in _CLAIM_COLUMNS:
+                self.claims[name] = np.concatenate(
+                    [np.asarray(self.claims[name])]
+                    + [columns[name][keep] for columns, keep in zip(parsed, keeps)]
+                )
 
-                if isinstance(data, list):
-                    claims_batch = data
-                else:
-                    claims_batch = [data]
+            # Int codes into sorted categories: less memory than one string
+            # object per claim, and grouping hashes ints instead of strings
+            # (built from sorted factorize codes over object categories, which
+            # skips pandas' inference of a pyarrow str dtype)
+            for name in _CATEGORICAL_CLAIM_COLUMNS:
+                codes, categories = pd.factorize(self.claims[name], sort=True)
+                self.claims[name] = pd.Categorical.from_codes(
+                    codes, pd.Index(categories, dtype=object)
+                )
 
-                for claim in claims_batch:
-                    if self._validate_claim(claim):
-                        if claim["npi"] in self.valid_npis:
-                            self.claims.append(claim)
+            self._claims_df = None
 
-            except Exception as e:
-                logger.error(f"Error reading claims file {json_file}: {e}")
-
-        logger.info(f"Loaded {len(self.claims)} valid claims")
+        logger.info(f"Loaded {len(self.claims['id'])} valid claims")
 
     def load_reverts(self, reverts_dir: str) -> None:
         """Load reverts data from JSON files in a single directory."""
@@ -87,8 +319,7 @@ class PharmacyDataProcessor:
         for json_file in reverts_path.glob("*.json"):
             logger.info(f"Processing reverts file: {json_file}")
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _load_json(json_file)
 
                 if isinstance(data, list):
                     reverts_batch = data
@@ -104,140 +335,136 @@ class PharmacyDataProcessor:
 
         logger.info(f"Loaded {len(self.reverts)} valid reverts")
 
-    def _validate_claim(self, claim: Dict) -> bool:
-        """Validate claim schema."""
-        required_fields = ["id", "npi", "ndc", "price", "quantity", "timestamp"]
-
-        for field in required_fields:
-            if field not in claim:
-                return False
+    @staticmethod
+    def _validate_claim(claim: Dict) -> bool:
+        """Validate claim schema.
 
-        try:
-            float(claim["price"])
-            int(claim["quantity"])
-            return True
-        except (ValueError, TypeError):
-            return False
+        Price and quantity types are checked vectorially once the whole
+        file is parsed; see _read_claims_file.
+        """
+        return _REQUIRED_CLAIM_FIELDS.issubset(claim)
 
     def _validate_revert(self, revert: Dict) -> bool:
         """Validate revert schema."""
         required_fields = ["id", "claim_id", "timestamp"]
 
-        for field in required_fields:
-            if field not in revert:
-                return False
+        return all(field in revert for field in required_fields)
 
     def calculate_metrics(self) -> List[Dict]:
         """Calculate metrics grouped by npi and ndc."""
         logger.info("Calculating metrics...")
 
-        # Create a set of reverted claim IDs for quick lookup
-        reverted_claim_ids = {revert["claim_id"] for revert in self.reverts}
-
-        # Group data by (npi, ndc)
-        metrics = defaultdict(
-            lambda: {"fills": 0, "reverted": 0, "total_price": 0.0, "prices": []}
+        # Hash index of reverted claim IDs for a batched membership test
+        revert_ids = pd.Index([revert["claim_id"] for revert in self.reverts])
+
+        claims = self.claims
+        price = claims["price"]
+        # int() semantics: fractional quantities are truncated
+        quantity = claims["quantity"].astype(np.int64)
+
+        unit_price = np.zeros_like(price)
+        np.divide(price, quantity, out=unit_price, where=quantity > 0)
+        reverted = pd.Index(claims["id"]).isin(revert_ids).astype(np.int64)
+
+        # Map each (npi, ndc) pair to a dense group id. Codes follow sorted
+        # key order, so results come out sorted by npi, then ndc
+        # Null keys are rejected at ingest; use_na_sentinel=False still keeps
+        # any null in its own group rather than a -1 code that would shift
+        # the combined id into another pharmacy's group
+        npi_codes, npis = pd.factorize(claims["npi"], sort=True, use_na_sentinel=False)
+        ndc_codes, ndcs = pd.factorize(claims["ndc"], sort=True, use_na_sentinel=False)
+        gid, pairs = pd.factorize(npi_codes * len(ndcs) + ndc_codes, sort=True)
+
+        fills, reverted_count, unit_sum, total_price = _aggregate_groups(
+            gid, len(pairs), price, unit_price, reverted
         )
 
-        # Process claims
-        for claim in self.claims:
-            npi = claim["npi"]
-            ndc = claim["ndc"]
-            key = (npi, ndc)
-
-            price = float(claim["price"])
-            quantity = int(claim["quantity"])
-
-            metrics[key]["fills"] += 1
-            metrics[key]["total_price"] += price
-
-            # Calculate unit price for average
-            unit_price = price / quantity if quantity > 0 else 0
-            metrics[key]["prices"].append(unit_price)
-
-            # Check if this claim is reverted
-            if claim["id"] in reverted_claim_ids:
-                metrics[key]["reverted"] += 1
-
-        # Convert to output format
-        results = []
-        for (npi, ndc), data in metrics.items():
-            avg_price = (
-                sum(data["prices"]) / len(data["prices"]) if data["prices"] else 0.0
-            )
-
-            results.append(
-                {
-                    "npi": npi,
-                    "ndc": ndc,
-                    "fills": data["fills"],
-                    "reverted": data["reverted"],
-                    "avg_price": round(avg_price, 2),
-                    "total_price": round(data["total_price"], 2),
-                }
-            )
-
-        # Sort by npi, then ndc for consistent output
-        results.sort(key=lambda x: (x["npi"], x["ndc"]))
+        metrics = pd.DataFrame(
+            {
+                "npi": np.asarray(npis)[pairs // len(ndcs)],
+                "ndc": np.asarray(ndcs)[pairs % len(ndcs)],
+                "fills": fills,
+                "reverted": reverted_count,
+                # Average from the running unit-price sum and the fill count.
+                # Rounded with round(), which unlike ndarray.round() is
+                # correctly rounded (11.425 -> 11.43, as before).
+                "avg_price": [round(x, 2) for x in (unit_sum / fills).tolist()],
+                "total_price": [round(x, 2) for x in total_price.tolist()],
+            }
+        )
+        results = metrics.to_dict("records")
 
         logger.info(f"Calculated metrics for {len(results)} npi/ndc combinations")
         return results
 
     def save_results(self, results: List[Dict], output_file: str) -> None:
-        """Save results to JSON file."""
+        """Save results to JSON file, one record per line."""
         logger.info(f"Saving results to {output_file}")
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Stream one compact record per line rather than building the whole
+        # indented document in memory first
+        with open(output_file, "wb") as f:
+            f.write(b"[\n")
+            for i, record in enumerate(results):
+                if i:
+                    f.write(b",\n")
+                f.write(_dump_json(record))
+            f.write(b"\n]\n")
 
         logger.info(f"Results saved successfully to {output_file}")
 
+    def _claims_frame(self) -> pd.DataFrame:
+        """Claims DataFrame shared by the pandas analyses, built on first use.
+
+        Built once from the claim columns along with each claim's pharmacy
+        chain and unit price, so the analyses do not derive their own.
+        """
+        if self._claims_df is None:
+            df = pd.DataFrame(self.claims, copy=False)
+            # Hashed npi -> chain join; unknown NPIs come back as NaN
+            chain = self._pharm_series.reindex(df["npi"]).to_numpy()
+            self._claims_df = df.assign(
+                chain=pd.Categorical(chain),
+                unit_price=df["price"] / df["quantity"].astype(np.int64),
+            )
+        return self._claims_df
+
     def analyze_chain_recommendations(self) -> List[Dict]:
         """Item 3: Top 2 chains by drug with lowest average unit prices."""
         logger.info("Analyzing chain recommendations...")
 
-        # Create DataFrame from claims data
-        claims_data = []
-        for claim in self.claims:
-            npi = claim["npi"]
-            if npi in self.pharmacies:
-                claims_data.append(
-                    {
-                        "ndc": claim["ndc"],
-                        "npi": npi,
-                        "chain": self.pharmacies[npi],
-                        "price": float(claim["price"]),
-                        "quantity": int(claim["quantity"]),
-                    }
-                )
+        # Select the needed columns from the shared claims DataFrame
+        df = self._claims_frame()[["ndc", "chain", "unit_price"]]
+        df = df.dropna(subset=["chain"])
 
-        if not claims_data:
+        if df.empty:
             logger.warning("No valid claims data for chain analysis")
             return []
 
-        df = pd.DataFrame(claims_data)
-
-        df["unit_price"] = df["price"] / df["quantity"]
-
-        chain_avg = df.groupby(["ndc", "chain"])["unit_price"].mean().reset_index()
+        chain_avg = (
+            df.groupby(["ndc", "chain"], observed=True)["unit_price"]
+            .mean()
+            .reset_index()
+        )
         chain_avg.columns = ["ndc", "chain", "avg_price"]
 
-        results = []
-        for ndc in chain_avg["ndc"].unique():
-            ndc_data = (
-                chain_avg[chain_avg["ndc"] == ndc].sort_values("avg_price").head(2)
-            )
+        # Rank chains within each drug once instead of filtering per drug
+        chain_avg = chain_avg.sort_values(["ndc", "avg_price"], kind="stable")
+        top2 = chain_avg.groupby("ndc", observed=True, sort=False).head(2)
+        # round() is correctly rounded, unlike Series.round() (0.015 -> 0.01)
+        top2 = top2.assign(avg_price=[round(x, 2) for x in top2["avg_price"].tolist()])
 
-            chain_list = []
-            for _, row in ndc_data.iterrows():
-                chain_list.append(
-                    {"name": row["chain"], "avg_price": round(row["avg_price"], 2)}
+        results = []
+        # Groups come out sorted by ndc (category order is sorted)
+        for ndc, ndc_data in top2.groupby("ndc", observed=True, sort=True):
+            chain_list = [
+                {"name": name, "avg_price": avg_price}
+                for name, avg_price in zip(
+                    ndc_data["chain"].tolist(), ndc_data["avg_price"].tolist()
                 )
-
+            ]
             results.append({"ndc": ndc, "chain": chain_list})
 
-        results.sort(key=lambda x: x["ndc"])
-
         logger.info(f"Generated chain recommendations for {len(results)} drugs")
         return results
 
@@ -245,39 +472,45 @@ class PharmacyDataProcessor:
         """Item 4: Most common quantities prescribed per drug."""
         logger.info("Analyzing common quantities...")
 
-        # Create DataFrame from claims data
-        claims_data = []
-        for claim in self.claims:
-            if claim["npi"] in self.pharmacies:
-                claims_data.append(
-                    {
-                        "ndc": claim["ndc"],
-                        "quantity": float(claim["quantity"]),
-                    }
-                )
+        # Claims were already restricted to known pharmacies at ingest
+        df = self._claims_frame()[["ndc", "quantity"]]
 
-        if not claims_data:
+        if df.empty:
             logger.warning("No valid claims data for quantity analysis")
             return []
 
-        df = pd.DataFrame(claims_data)
-
-        results = []
-        for ndc in df["ndc"].unique():
-            ndc_data = df[df["ndc"] == ndc]
-
-            # Get the most common quantities (top 5)
-            quantity_counts = ndc_data["quantity"].value_counts().head(5)
-            most_prescribed = quantity_counts.index.tolist()
-
-            results.append({"ndc": ndc, "most_prescribed_quantity": most_prescribed})
+        # Count quantities for every drug in one pass, most common first.
+        # Ties keep first-occurrence order, as Series.value_counts() does.
+        quantity_counts = (
+            df.assign(row=np.arange(len(df)))
+            .groupby(["ndc", "quantity"], observed=True)["row"]
+            .agg(["size", "min"])
+            .reset_index()
+            .sort_values(["ndc", "size", "min"], ascending=[True, False, True])
+        )
+        # Get the most common quantities (top 5)
+        top5 = quantity_counts.groupby("ndc", observed=True).head(5)
 
-        results.sort(key=lambda x: x["ndc"])
+        results = [
+            {"ndc": ndc, "most_prescribed_quantity": ndc_data["quantity"].tolist()}
+            for ndc, ndc_data in top5.groupby("ndc", observed=True, sort=True)
+        ]
 
         logger.info(f"Generated quantity analysis for {len(results)} drugs")
         return results
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that need a count of at least one."""
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}")
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return count
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Process pharmacy claims data")
@@ -302,6 +535,12 @@ def main():
         default="metrics_output.json",
         help="Output JSON file (default: metrics_output.json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="Processes used to parse claims files (default: one per CPU)",
+    )
 
     args = parser.parse_args()
 
@@ -314,7 +553,7 @@ def main():
         # processor.load_claims("data/claims")
         # processor.load_reverts("data/reverts")
         processor.load_pharmacies(args.pharmacy_dir)
-        processor.load_claims(args.claims_dir)
+        processor.load_claims(args.claims_dir, max_workers=args.workers)
         processor.load_reverts(args.reverts_dir)
 
         # Calculate metrics (Items 1 & 2)
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from main import PharmacyDataProcessor
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def load_sample_data() -> PharmacyDataProcessor:
+    processor = PharmacyDataProcessor()
+    processor.load_pharmacies(str(DATA_DIR / "pharmacies"))
+    processor.load_claims(str(DATA_DIR / "claims"), max_workers=1)
+    processor.load_reverts(str(DATA_DIR / "reverts"))
+    return processor
+
+
+def test_validate_revert_accepts_complete_revert():
+    revert = {"id": "r1", "claim_id": "c1", "timestamp": "2024-01-01T00:00:00"}
+    assert PharmacyDataProcessor()._validate_revert(revert) is True
+
+
+def test_reverted_counts_on_sample_data():
+    processor = load_sample_data()
+
+    assert processor.reverts
+    metrics = processor.calculate_metrics()
+    assert any(row["reverted"] > 0 for row in metrics)